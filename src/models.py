@@ -1,10 +1,12 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans, kmeans_plusplus
 from sklearn.mixture import GaussianMixture
+from sklearn.utils._param_validation import InvalidParameterError
 
 from .visualization import plot_pca_scatter
 
@@ -68,3 +70,264 @@ class ClinicalClustering:
         df["Cluster"] = labels.astype(str)
         plot_pca_scatter(df, cluster_col="Cluster", title=title, save_path=save_path)
 
+
+GMM_COVARIANCE_TYPES = ("full", "tied", "diag", "spherical")
+_GMM_REG_COVAR = 1e-6  # GaussianMixture default, also used for seeded precisions
+
+
+def _gmm_init_from_centroids(
+    X: np.ndarray,
+    centers: np.ndarray,
+    covariance_type: str,
+) -> Dict[str, np.ndarray]:
+    """
+    Build weights/means/precisions for a GaussianMixture from fixed centroids.
+
+    Samples are hard-assigned to their nearest centroid, so the starting model
+    matches the precomputed k-means partition. Clusters with fewer than two
+    samples fall back to the covariance of the whole dataset.
+    """
+    n_samples, n_features = X.shape
+    k = centers.shape[0]
+    labels = ((X[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    counts = np.bincount(labels, minlength=k)
+    weights = counts + 10 * np.finfo(float).eps
+    weights /= weights.sum()
+
+    diffs = X - centers[labels]
+    eye = np.eye(n_features) * _GMM_REG_COVAR
+    if covariance_type == "tied":
+        precisions = np.linalg.inv(diffs.T @ diffs / n_samples + eye)
+        precisions = (precisions + precisions.T) / 2
+    else:
+        pooled = np.atleast_2d(np.cov(X, rowvar=False))
+        covariances = np.empty((k, n_features, n_features))
+        for j in range(k):
+            d = diffs[labels == j]
+            covariances[j] = (d.T @ d / counts[j] if counts[j] > 1 else pooled) + eye
+        if covariance_type == "full":
+            precisions = np.linalg.inv(covariances)
+            precisions = (precisions + precisions.transpose(0, 2, 1)) / 2
+        elif covariance_type == "diag":
+            precisions = 1.0 / np.diagonal(covariances, axis1=1, axis2=2)
+        else:
+            precisions = 1.0 / np.diagonal(covariances, axis1=1, axis2=2).mean(axis=1)
+
+    return {"weights_init": weights, "means_init": centers, "precisions_init": precisions}
+
+
+def _fit_gmm_candidate(
+    X: pd.DataFrame,
+    n_components: int,
+    covariance_type: str,
+    seed: int,
+    centers: Optional[np.ndarray],
+    init_params: str,
+    max_iter: int,
+    tol: float,
+):
+    """
+    Fit a single GMM initialisation and score it (runs inside a joblib worker).
+
+    With `centers`, the start is built from those centroids and the internal
+    k-means initialisation is skipped. `init_params="k-means++"` does the same
+    with centroids drawn by k-means++ seeding; other values are passed to
+    GaussianMixture unchanged. A fit that fails (e.g. ill-defined
+    empirical covariance) returns (None, -inf, nan, nan) so the rest of the
+    sweep is kept; invalid parameters still raise.
+    """
+    seeded = {}
+    try:
+        if centers is None and init_params == "k-means++":
+            centers, _ = kmeans_plusplus(
+                np.asarray(X, dtype=float), n_components, random_state=seed
+            )
+        if centers is not None:
+            seeded = _gmm_init_from_centroids(
+                np.asarray(X, dtype=float), np.asarray(centers, dtype=float), covariance_type
+            )
+            # resp from "random_from_data" is discarded once all three inits are given
+            init_params = "random_from_data"
+        gmm = GaussianMixture(
+            n_components=n_components,
+            covariance_type=covariance_type,
+            init_params=init_params,
+            reg_covar=_GMM_REG_COVAR,
+            max_iter=max_iter,
+            tol=tol,
+            random_state=seed,
+            **seeded,
+        )
+        gmm.fit(X)
+    except InvalidParameterError:
+        raise
+    except ValueError:
+        return None, -np.inf, np.nan, np.nan
+    return gmm, gmm.lower_bound_, gmm.bic(X), gmm.aic(X)
+
+
+@dataclass
+class GMMSweepResult:
+    """
+    Output of `gmm_bic_sweep`.
+
+    - best_model: fitted GaussianMixture with the lowest criterion value
+    - surface: one row per (k, covariance_type) with the BIC/AIC of its best init
+    """
+
+    best_model: GaussianMixture
+    surface: pd.DataFrame
+    criterion: str = "bic"
+    best_params: Dict[str, object] = field(default_factory=dict)
+
+
+def gmm_bic_sweep(
+    X: pd.DataFrame,
+    k_values: Sequence[int] = (2, 3, 4, 5, 6),
+    covariance_types: Sequence[str] = ("full", "tied", "diag", "spherical"),
+    n_init: int = 10,
+    batch_size: int = 4,
+    plateau_tol: float = 1e-3,
+    kmeans_centers: Optional[Dict[int, np.ndarray]] = None,
+    init_params: str = "k-means++",
+    criterion: str = "bic",
+    max_iter: int = 100,
+    tol: float = 1e-3,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> GMMSweepResult:
+    """
+    Fit GMMs over a grid of k and covariance types, in parallel across cores.
+
+    Initialisations for every (k, covariance_type) pair are run in rounds of
+    `batch_size`; all pairs still in play are fitted together in one parallel
+    round. A pair stops early once a round fails to raise its best per-sample
+    log-likelihood lower bound by more than `plateau_tol`, or after `n_init`
+    initialisations.
+
+    If `kmeans_centers` maps k to an array of shape (k, n_features) - e.g.
+    `ClinicalClustering(n_clusters=k).model.cluster_centers_` fitted on the
+    same X - the first initialisation for that k starts from the weights,
+    means and covariances of that partition instead of a fresh k-means run.
+    Other initialisations use `init_params`: the default "k-means++" starts
+    from k-means++ centroids the same way, which is cheaper than
+    GaussianMixture's full k-means start; any other value is passed through.
+
+    Grid points whose every initialisation failed, or whose k exceeds the
+    number of samples, are kept in the surface with NaN scores and are never
+    selected.
+
+    Returns the best model by `criterion` ("bic" or "aic") together with the
+    whole BIC/AIC surface.
+    """
+    criterion = criterion.lower()
+    if criterion not in ("bic", "aic"):
+        raise ValueError(f"Unsupported criterion='{criterion}'. Use 'bic' or 'aic'.")
+    if n_init < 1 or batch_size < 1:
+        raise ValueError("n_init and batch_size must be >= 1.")
+    if len(k_values) == 0 or len(covariance_types) == 0:
+        raise ValueError("k_values and covariance_types must not be empty.")
+    bad_k = [
+        k for k in k_values
+        if isinstance(k, bool) or not isinstance(k, (int, np.integer)) or k < 1
+    ]
+    if bad_k:
+        raise ValueError(f"k_values must be integers >= 1, got {bad_k}.")
+    bad_cov = [cov for cov in covariance_types if cov not in GMM_COVARIANCE_TYPES]
+    if bad_cov:
+        raise ValueError(
+            f"Unsupported covariance_types {bad_cov}. Use any of {list(GMM_COVARIANCE_TYPES)}."
+        )
+
+    X_arr = np.asarray(X, dtype=float)
+    kmeans_centers = kmeans_centers or {}
+    unknown_k = sorted(set(kmeans_centers) - set(k_values))
+    if unknown_k:
+        raise ValueError(f"kmeans_centers has keys {unknown_k} that are not in k_values.")
+    for k, centers in kmeans_centers.items():
+        if np.shape(centers) != (k, X_arr.shape[1]):
+            raise ValueError(
+                f"kmeans_centers[{k}] has shape {np.shape(centers)}, "
+                f"expected ({k}, {X_arr.shape[1]})."
+            )
+
+    configs = [(k, cov) for k in k_values for cov in covariance_types]
+    state = {
+        # k > n_samples can never fit, so those grid points are not scheduled
+        cfg: {"best": None, "bound": -np.inf, "n_run": 0, "active": cfg[0] <= X_arr.shape[0]}
+        for cfg in configs
+    }
+    rng = np.random.RandomState(random_state)
+
+    with Parallel(n_jobs=n_jobs) as parallel:
+        while True:
+            tasks = []
+            for cfg in configs:
+                st = state[cfg]
+                if not st["active"]:
+                    continue
+                k, cov = cfg
+                n_batch = min(batch_size, n_init - st["n_run"])
+                for i in range(st["n_run"], st["n_run"] + n_batch):
+                    centers = kmeans_centers.get(k) if i == 0 else None
+                    seed = int(rng.randint(np.iinfo(np.int32).max))
+                    tasks.append((cfg, (k, cov, seed, centers)))
+                st["n_run"] += n_batch
+            if not tasks:
+                break
+
+            fits = parallel(
+                delayed(_fit_gmm_candidate)(
+                    X, k, cov, seed, centers, init_params, max_iter, tol
+                )
+                for _, (k, cov, seed, centers) in tasks
+            )
+
+            round_best = {}
+            for (cfg, _), fit in zip(tasks, fits):
+                if cfg not in round_best or fit[1] > round_best[cfg][1]:
+                    round_best[cfg] = fit
+            for cfg, fit in round_best.items():
+                st = state[cfg]
+                if fit[0] is None:
+                    # Whole round failed: stop if a fit already exists, otherwise retry
+                    improvement = -np.inf if st["best"] is not None else np.inf
+                else:
+                    improvement = fit[1] - st["bound"]
+                if fit[0] is not None and improvement > 0:
+                    st["best"], st["bound"] = fit, fit[1]
+                if st["n_run"] >= n_init or improvement <= plateau_tol:
+                    st["active"] = False
+
+    rows = []
+    for (k, cov), st in state.items():
+        gmm, bound, bic, aic = st["best"] or (None, np.nan, np.nan, np.nan)
+        rows.append(
+            {
+                "k": k,
+                "covariance_type": cov,
+                "bic": bic,
+                "aic": aic,
+                "lower_bound": bound,
+                "converged": gmm.converged_ if gmm is not None else pd.NA,
+                "n_iter": gmm.n_iter_ if gmm is not None else pd.NA,
+                "n_init_run": st["n_run"],
+            }
+        )
+    surface = (
+        pd.DataFrame(rows)
+        .astype({"converged": "boolean", "n_iter": "Int64"})
+        .sort_values(["covariance_type", "k"])
+        .reset_index(drop=True)
+    )
+
+    if surface[criterion].isna().all():
+        raise ValueError("Every GMM fit in the sweep failed; no model to return.")
+    best_row = surface.loc[surface[criterion].idxmin()]
+    best_cfg = (int(best_row["k"]), best_row["covariance_type"])
+    return GMMSweepResult(
+        best_model=state[best_cfg]["best"][0],
+        surface=surface,
+        criterion=criterion,
+        best_params={"n_components": best_cfg[0], "covariance_type": best_cfg[1]},
+    )